@@ -77,7 +77,7 @@ function BilingualAdminLayout({ children }: { children: React.ReactNode }) {
         isRTL 
           ? `right-0 border-l lg:translate-x-0 ${sidebarOpen ? 'translate-x-0' : 'translate-x-full'}`
           : `left-0 border-r lg:translate-x-0 ${sidebarOpen ? 'translate-x-0' : '-translate-x-full'}`
-      }`}>
+      }`} data-testid="admin-sidebar">
         <div className={`flex items-center justify-between h-16 px-6 border-b border-gray-200 dark:border-gray-700 ${isRTL ? 'flex-row-reverse' : 'flex-row'}`}>
           <h1 className="text-lg font-semibold text-gray-900 dark:text-white">
             Limitpass
@@ -14,8 +14,8 @@ const formatPersianPrice = (price: string | null): string => {
 
 export default function AdminDashboard() {
   const { t, isRTL } = useAdminLanguage();
-  const { data: products = [] } = useProducts();
-  const { data: categories = [] } = useCategories();
+  const { data: products = [], isLoading: productsLoading } = useProducts();
+  const { data: categories = [], isLoading: categoriesLoading } = useCategories();
 
   const stats = [
     {
@@ -72,7 +72,7 @@ export default function AdminDashboard() {
   };
 
   return (
-    <div className="space-y-6" dir={isRTL ? 'rtl' : 'ltr'}>
+    <div className="space-y-6" dir={isRTL ? 'rtl' : 'ltr'} aria-busy={productsLoading || categoriesLoading}>
       {/* Header */}
       <div>
         <h1 className="text-3xl font-bold text-gray-900 dark:text-white" data-testid="admin-dashboard-title">
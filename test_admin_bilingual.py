@@ -1,225 +1,410 @@
 #!/usr/bin/env python3
 
 import asyncio
-import time
+import fcntl
+import io
+import json
+import logging
+import os
+import re
+import sys
+from contextlib import asynccontextmanager, contextmanager
+
+import pytest
+import pytest_asyncio
+from PIL import Image
 from playwright.async_api import async_playwright
 
-async def test_bilingual_admin_panel():
-    """Test the bilingual admin panel layout functionality"""
+# Level the logger itself: pytest owns the root logger's handlers, so basicConfig would be a no-op
+log = logging.getLogger('admin-e2e')
+log.setLevel(os.environ.get('LOGLEVEL', 'INFO'))
+
+BASE_URL = 'http://localhost:5000'
+# Chromium locks a profile to one process, so every xdist worker gets its own
+USER_DATA_DIR = f".pw-user-{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
+HEADLESS = os.environ.get('HEADLESS', 'true').lower() not in ('0', 'false', 'no')
+LANGUAGE_CODES = {'english': 'en', 'persian': 'fa'}
+DESKTOP_VIEWPORT = {'width': 1920, 'height': 1080}
+MOBILE_VIEWPORT = {'width': 375, 'height': 667}
+
+# Cap every Playwright action so a hung click fails in seconds, not after the 30 s default
+ACTION_TIMEOUT_MS = 10000
+NAVIGATION_TIMEOUT_MS = 15000
+
+# Third-party hosts that never affect the admin layout but keep the network busy. Chromium
+# fails their DNS lookups itself, so same-origin requests never detour through Python.
+BLOCKED_HOSTS = ('*.google-analytics.com', '*.googletagmanager.com', '*.hotjar.com', '*.sentry.io',
+                 '*.doubleclick.net', 'fonts.googleapis.com', 'fonts.gstatic.com')
+HOST_RESOLVER_RULES = ', '.join(f'MAP {host} ~NOTFOUND' for host in BLOCKED_HOSTS)
+
+SIDEBAR_IN_VIEW = """() => {
+    const r = document.querySelector('[data-testid="admin-sidebar"]').getBoundingClientRect();
+    return r.left >= 0 && r.right <= window.innerWidth;
+}"""
+
+SIDEBAR_OUT_OF_VIEW = """() => {
+    const r = document.querySelector('[data-testid="admin-sidebar"]').getBoundingClientRect();
+    return r.right <= 0 || r.left >= window.innerWidth;
+}"""
+
+# Test id that marks each admin route as mounted. Some titles render while data is still
+# loading, so navigate_and_capture also waits for PAGE_SETTLED before taking its shot.
+SECTION_LANDMARKS = {
+    '/admin': 'admin-dashboard-title',
+    '/admin/products': 'admin-products-title',
+    '/admin/categories': 'admin-categories-title',
+    '/admin/pages': 'admin-pages-title',
+    '/admin/blog': 'admin-blog-dashboard-title',
+    '/admin/blog/posts': 'admin-blog-posts-title',
+    '/admin/blog/authors': 'page-title',
+    '/admin/blog/categories': 'admin-blog-categories-title',
+    '/admin/blog/tags': 'admin-blog-tags-title',
+}
+
+# True once no skeleton, spinner or aria-busy region (the dashboard's stats) is left on the page
+PAGE_SETTLED = """() => !document.querySelector('.animate-pulse, .animate-spin, [aria-busy="true"]')"""
+
+# Routes behind the sidebar entries, as (path, label) pairs
+ADMIN_SECTIONS = [
+    ('/admin', 'Dashboard'),
+    ('/admin/products', 'Products'),
+    ('/admin/categories', 'Categories'),
+    ('/admin/blog', 'Blog'),
+    ('/admin/pages', 'Pages'),
+]
+
+BLOG_SUBSECTIONS = [
+    ('/admin/blog', 'Blog Dashboard'),
+    ('/admin/blog/posts', 'Blog Posts'),
+    ('/admin/blog/authors', 'Authors'),
+    ('/admin/blog/categories', 'Blog Categories'),
+    ('/admin/blog/tags', 'Tags'),
+]
+
+# Every section as (path, screenshot label, test group), with labels slugged once at import
+NAV_CASES = [
+    *[(path, name.lower().replace(' ', '_'), 4) for path, name in ADMIN_SECTIONS],
+    *[(path, name.lower().replace(' ', '_'), 5) for path, name in BLOG_SUBSECTIONS],
+]
+
+SIDEBAR_SELECTOR = '[data-testid="admin-sidebar"]'
+
+# Every DOM read a checkpoint needs, gathered in a single round-trip to the browser
+LAYOUT_PROBE = """() => {
+    const isVisible = (el) => {
+        if (!el) return false;
+        const rect = el.getBoundingClientRect();
+        // The off-canvas sidebar keeps its size when translated away, so it must also overlap the viewport
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden'
+            && rect.right > 0 && rect.left < window.innerWidth && rect.bottom > 0 && rect.top < window.innerHeight;
+    };
     
-    async with async_playwright() as p:
-        # Launch browser
-        browser = await p.chromium.launch(headless=False)
-        context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
-        page = await context.new_page()
-        
-        print("🚀 Starting bilingual admin panel tests...")
+    const sidebar = document.querySelector('[data-testid="admin-sidebar"]');
+    const main = document.querySelector('main');
+    
+    let blocking = { error: 'Elements not found' };
+    if (sidebar && main) {
+        const sidebarRect = sidebar.getBoundingClientRect();
+        const mainRect = main.getBoundingClientRect();
         
+        // Check if main content has proper left margin
+        const computedStyle = window.getComputedStyle(main.parentElement);
+        blocking = {
+            sidebarWidth: sidebarRect.width,
+            mainLeft: mainRect.left,
+            paddingLeft: parseInt(computedStyle.paddingLeft) || 0,
+            marginLeft: parseInt(computedStyle.marginLeft) || 0,
+            isBlocking: mainRect.left < sidebarRect.right
+        };
+    }
+    
+    return {
+        dir: document.documentElement.dir,
+        sidebarVisible: isVisible(sidebar),
+        mainVisible: isVisible(main),
+        mobileMenuVisible: isVisible(document.querySelector('[data-testid="open-sidebar"]')),
+        blocking: blocking
+    };
+}"""
+
+async def wait_for_language(page, lang):
+    """Wait until the admin layout has applied the given language and its text direction"""
+    direction = 'rtl' if lang == 'persian' else 'ltr'
+    await page.wait_for_function(
+        f"document.documentElement.dir === '{direction}' && document.documentElement.lang === '{LANGUAGE_CODES[lang]}'",
+        timeout=5000,
+    )
+
+async def wait_for_viewport_width(page, width):
+    """Wait until the page has reflowed to the given viewport width"""
+    await page.wait_for_function(f"window.innerWidth === {width}", timeout=5000)
+
+# Perceptual hash of every screenshot on disk, kept between runs
+SCREENSHOT_HASHES_PATH = 'admin_screenshot_hashes.json'
+
+# Admin session cookies shared by every xdist worker
+ADMIN_SESSION_PATH = 'admin_session.json'
+
+@contextmanager
+def file_lock(path):
+    """Hold an exclusive lock shared with every other process on this machine"""
+    with open(path, 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+def load_screenshot_hashes():
+    try:
+        with open(SCREENSHOT_HASHES_PATH) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+# Screenshot files still being written in the background, and the hashes they changed
+pending_writes = []
+screenshot_hashes = load_screenshot_hashes()
+changed_hashes = {}
+
+def dhash(data):
+    """64-bit difference hash: one bit per horizontally adjacent pixel pair of a 9x8 grayscale thumbnail"""
+    with Image.open(io.BytesIO(data)) as image:
+        pixels = list(image.convert('L').resize((9, 8), Image.Resampling.LANCZOS).getdata())
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            bits = (bits << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return f'{bits:016x}'
+
+def store_screenshot(path, data, *, skip_unchanged):
+    """Write the screenshot, optionally skipping it when it looks the same as the copy already on disk"""
+    if skip_unchanged:
+        # A 64-bit dhash cannot tell small regressions apart, so this is only used for
+        # routine checkpoint shots; baselines and failure captures are always rewritten
+        digest = dhash(data)
+        if screenshot_hashes.get(path) == digest and os.path.exists(path):
+            log.info("%s unchanged (dhash %s), kept the previous file", path, digest)
+            return
+        changed_hashes[path] = digest
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def save_screenshot_hashes():
+    """Merge this process's hash updates into the index; xdist workers share one file"""
+    with file_lock(f'{SCREENSHOT_HASHES_PATH}.lock'):
+        hashes = load_screenshot_hashes()
+        hashes.update(changed_hashes)
+        with open(SCREENSHOT_HASHES_PATH, 'w') as f:
+            json.dump(hashes, f, indent=2, sort_keys=True)
+    changed_hashes.clear()
+
+async def flush_screenshots():
+    """Wait for every background screenshot write to land on disk and record the new hashes"""
+    await asyncio.gather(*pending_writes)
+    pending_writes.clear()
+    if changed_hashes:
+        await asyncio.to_thread(save_screenshot_hashes)
+
+async def snap(page, name, *, baseline=False, always_write=False):
+    """Screenshot the page: full-page PNG for visual-diff baselines, viewport JPEG otherwise
+
+    Viewport shots that look unchanged are not rewritten unless always_write is set.
+    """
+    # Finish CSS transitions (the sidebar slides for 200 ms) so no shot catches a frame mid-way
+    if baseline:
+        path = f'{name}.png'
+        data = await page.screenshot(full_page=True, type='png', animations='disabled')
+    else:
+        path = f'{name}.jpg'
+        data = await page.screenshot(full_page=False, type='jpeg', quality=70, animations='disabled')
+    
+    # Hand the bytes off so hashing and the disk write overlap with the next test step
+    pending_writes.append(asyncio.create_task(
+        asyncio.to_thread(store_screenshot, path, data, skip_unchanged=not (baseline or always_write))
+    ))
+
+async def switch_language(page, lang):
+    """Switch the admin language through the header dropdown and wait for it to apply"""
+    await page.click('[data-testid="admin-language-switcher"]')
+    await page.locator(f'[data-testid="switch-to-{lang}"]').wait_for()
+    await page.click(f'[data-testid="switch-to-{lang}"]')
+    # Switching is client-side only (no translation request is made), so the
+    # <html> attributes set by AdminLanguageContext are the exact completion signal
+    await wait_for_language(page, lang)
+
+@asynccontextmanager
+async def open_admin_page(context, lang, *, viewport=DESKTOP_VIEWPORT, path='/admin', landmark=SIDEBAR_SELECTOR):
+    """Open a page on an admin route and wait for its landmark, closing the page afterwards
+
+    On failure the page is left open for the failure_screenshots fixture to capture and close.
+    """
+    page = await context.new_page()
+    await page.set_viewport_size(viewport)
+    
+    # The admin language lives in localStorage, so pin it before the app boots
+    await page.add_init_script(f"localStorage.setItem('admin-language', '{LANGUAGE_CODES[lang]}')")
+    await page.goto(f'{BASE_URL}{path}')
+    
+    # Wait for the page's own landmark instead of network quiescence
+    await page.locator(landmark).first.wait_for(state='visible')
+    yield page
+    await page.close()
+
+async def navigate_and_capture(context, path, label, group, lang='english'):
+    """Open a fresh page directly on one admin section and screenshot it once it has rendered"""
+    landmark = f'[data-testid="{SECTION_LANDMARKS[path]}"]'
+    
+    # Loading the route directly skips booting /admin first and simulating the nav click
+    async with open_admin_page(context, lang, path=path, landmark=landmark) as page:
+        await page.wait_for_function(PAGE_SETTLED)
+        await snap(page, f'admin_test_{group}_{label}_{lang}')
+
+async def login(context):
+    """Make sure the context holds an authenticated admin session"""
+    # /api/admin/login allows 5 attempts per IP per 10 minutes, successful ones included,
+    # so workers take turns and reuse the cookies of whichever one logged in last. Blocking
+    # the event loop on the lock is fine: nothing else runs during session setup.
+    with file_lock(f'{ADMIN_SESSION_PATH}.lock'):
         try:
-            # Navigate to admin panel
-            print("📍 Navigating to admin panel...")
-            await page.goto('http://localhost:5000/admin')
-            await page.wait_for_load_state('networkidle')
-            
-            # Check if we need to login
+            with open(ADMIN_SESSION_PATH) as f:
+                await context.add_cookies(json.load(f))
+        except FileNotFoundError:
+            pass
+        
+        async with open_admin_page(context, 'persian',
+                                   landmark=f'[data-testid="admin-password-input"], {SIDEBAR_SELECTOR}') as page:
+            # Check if we need to login (no shared session yet, or the server no longer knows it)
             if await page.locator('[data-testid="admin-password-input"]').is_visible():
-                print("🔐 Logging into admin panel...")
+                log.info("Logging into admin panel")
                 await page.fill('[data-testid="admin-password-input"]', 'admin123')
                 await page.click('[data-testid="admin-login-button"]')
-                await page.wait_for_load_state('networkidle')
-                await asyncio.sleep(2)
-            
-            # ========== TEST 1: Initial Layout in Persian (RTL) ==========
-            print("\n📱 TEST 1: Testing initial layout in Persian (RTL)")
-            await page.screenshot(path='admin_test_1_persian_initial.png', full_page=True)
-            
-            # Check if layout is RTL
-            html_dir = await page.evaluate("document.documentElement.dir")
-            print(f"   Document direction: {html_dir}")
-            
-            # Check sidebar visibility and positioning
-            sidebar_visible = await page.locator('.fixed.inset-y-0.z-50.w-64').is_visible()
-            print(f"   Sidebar visible: {sidebar_visible}")
-            
-            # Check if main content has proper margin/padding for sidebar
-            main_content = page.locator('main')
-            main_content_visible = await main_content.is_visible()
-            print(f"   Main content visible: {main_content_visible}")
-            
-            # ========== TEST 2: Language Switching to English ==========
-            print("\n🌐 TEST 2: Testing language switch to English")
-            
-            # Click language switcher
-            await page.click('[data-testid="admin-language-switcher"]')
-            await asyncio.sleep(1)
-            
-            # Switch to English
-            await page.click('[data-testid="switch-to-english"]')
-            await asyncio.sleep(2)
-            await page.wait_for_load_state('networkidle')
-            
-            # Take screenshot after language switch
-            await page.screenshot(path='admin_test_2_english_layout.png', full_page=True)
-            
-            # Check if layout switched to LTR
-            html_dir_after = await page.evaluate("document.documentElement.dir")
-            print(f"   Document direction after switch: {html_dir_after}")
-            
-            # ========== TEST 3: Sidebar Functionality in English ==========
-            print("\n📱 TEST 3: Testing sidebar functionality in English")
-            
-            # Test desktop sidebar (should not block content)
-            sidebar_blocking = await page.evaluate("""
-                const sidebar = document.querySelector('.fixed.inset-y-0.z-50.w-64');
-                const main = document.querySelector('main');
-                if (!sidebar || !main) return 'Elements not found';
+                await page.locator(SIDEBAR_SELECTOR).wait_for()
                 
-                const sidebarRect = sidebar.getBoundingClientRect();
-                const mainRect = main.getBoundingClientRect();
-                
-                // Check if main content has proper left margin
-                const computedStyle = window.getComputedStyle(main.parentElement);
-                const paddingLeft = parseInt(computedStyle.paddingLeft) || 0;
-                const marginLeft = parseInt(computedStyle.marginLeft) || 0;
-                
-                return {
-                    sidebarWidth: sidebarRect.width,
-                    mainLeft: mainRect.left,
-                    paddingLeft: paddingLeft,
-                    marginLeft: marginLeft,
-                    isBlocking: mainRect.left < sidebarRect.right
-                };
-            """)
-            print(f"   Sidebar blocking analysis: {sidebar_blocking}")
-            
-            # ========== TEST 4: Navigation Menu Testing ==========
-            print("\n🧭 TEST 4: Testing navigation in both languages")
-            
-            # Test navigation to different admin sections
-            admin_sections = [
-                ('[data-testid="admin-nav-dashboard"]', 'Dashboard'),
-                ('[data-testid="admin-nav-products"]', 'Products'),
-                ('[data-testid="admin-nav-categories"]', 'Categories'),
-                ('[data-testid="admin-nav-blog"]', 'Blog'),
-                ('[data-testid="admin-nav-pages"]', 'Pages'),
-            ]
-            
-            for selector, section_name in admin_sections:
-                print(f"   Testing {section_name} section...")
-                try:
-                    await page.click(selector)
-                    await asyncio.sleep(1)
-                    await page.wait_for_load_state('networkidle')
-                    
-                    # Take screenshot of section
-                    await page.screenshot(path=f'admin_test_4_{section_name.lower()}_english.png', full_page=True)
-                except Exception as e:
-                    print(f"   Error testing {section_name}: {e}")
-            
-            # ========== TEST 5: Blog Sub-navigation ==========
-            print("\n📝 TEST 5: Testing blog sub-navigation")
-            
-            # Click on blog to expand sub-menu
-            await page.click('[data-testid="admin-nav-blog"]')
-            await asyncio.sleep(1)
-            
-            blog_subsections = [
-                ('[data-testid="admin-nav-blog-blog dashboard"]', 'Blog Dashboard'),
-                ('[data-testid="admin-nav-blog-blog posts"]', 'Blog Posts'),
-                ('[data-testid="admin-nav-blog-authors"]', 'Authors'),
-                ('[data-testid="admin-nav-blog-categories"]', 'Blog Categories'),
-                ('[data-testid="admin-nav-blog-tags"]', 'Tags'),
-            ]
-            
-            for selector, section_name in blog_subsections:
-                print(f"   Testing {section_name} subsection...")
-                try:
-                    await page.click(selector)
-                    await asyncio.sleep(1)
-                    await page.wait_for_load_state('networkidle')
-                    
-                    # Take screenshot
-                    await page.screenshot(path=f'admin_test_5_{section_name.lower().replace(" ", "_")}_english.png', full_page=True)
-                except Exception as e:
-                    print(f"   Error testing {section_name}: {e}")
-            
-            # ========== TEST 6: Switch back to Persian ==========
-            print("\n🌐 TEST 6: Testing switch back to Persian")
-            
-            # Switch back to Persian
-            await page.click('[data-testid="admin-language-switcher"]')
-            await asyncio.sleep(1)
-            await page.click('[data-testid="switch-to-persian"]')
-            await asyncio.sleep(2)
-            await page.wait_for_load_state('networkidle')
-            
-            # Take screenshot in Persian
-            await page.screenshot(path='admin_test_6_persian_return.png', full_page=True)
-            
-            # Check RTL again
-            html_dir_persian = await page.evaluate("document.documentElement.dir")
-            print(f"   Document direction back to Persian: {html_dir_persian}")
-            
-            # ========== TEST 7: Mobile Responsiveness ==========
-            print("\n📱 TEST 7: Testing mobile responsiveness")
-            
-            # Test mobile viewport in Persian
-            await page.set_viewport_size({'width': 375, 'height': 667})
-            await asyncio.sleep(2)
-            await page.screenshot(path='admin_test_7_mobile_persian.png', full_page=True)
-            
-            # Test mobile menu button
-            mobile_menu_btn = page.locator('[data-testid="open-sidebar"]')
-            if await mobile_menu_btn.is_visible():
-                print("   Mobile menu button visible - testing mobile sidebar")
-                await mobile_menu_btn.click()
-                await asyncio.sleep(1)
-                await page.screenshot(path='admin_test_7_mobile_sidebar_open.png', full_page=True)
-                
-                # Close mobile sidebar
-                close_btn = page.locator('[data-testid="close-sidebar"]')
-                if await close_btn.is_visible():
-                    await close_btn.click()
-                    await asyncio.sleep(1)
-            
-            # Switch to English in mobile
-            await page.click('[data-testid="admin-language-switcher"]')
-            await asyncio.sleep(1)
-            await page.click('[data-testid="switch-to-english"]')
-            await asyncio.sleep(2)
-            await page.screenshot(path='admin_test_7_mobile_english.png', full_page=True)
-            
-            # ========== TEST 8: Desktop view final verification ==========
-            print("\n🖥️ TEST 8: Final desktop verification")
-            
-            # Return to desktop view
-            await page.set_viewport_size({'width': 1920, 'height': 1080})
-            await asyncio.sleep(2)
-            await page.screenshot(path='admin_test_8_final_desktop.png', full_page=True)
-            
-            print("\n✅ All tests completed successfully!")
-            print("📸 Screenshots saved:")
-            print("   - admin_test_1_persian_initial.png")
-            print("   - admin_test_2_english_layout.png") 
-            print("   - admin_test_4_*.png (navigation sections)")
-            print("   - admin_test_5_*.png (blog subsections)")
-            print("   - admin_test_6_persian_return.png")
-            print("   - admin_test_7_mobile_*.png")
-            print("   - admin_test_8_final_desktop.png")
-            
-            # Final analysis
-            print("\n📊 Test Results Summary:")
-            print(f"   ✓ Initial Persian RTL: {'✅' if html_dir == 'rtl' else '❌'}")
-            print(f"   ✓ Switch to English LTR: {'✅' if html_dir_after == 'ltr' else '❌'}")
-            print(f"   ✓ Return to Persian RTL: {'✅' if html_dir_persian == 'rtl' else '❌'}")
-            print(f"   ✓ Sidebar not blocking content: {'✅' if not sidebar_blocking.get('isBlocking', True) else '❌'}")
-            
-        except Exception as e:
-            print(f"❌ Test failed with error: {e}")
-            await page.screenshot(path='admin_test_error.png', full_page=True)
+                with open(ADMIN_SESSION_PATH, 'w') as f:
+                    json.dump(await context.cookies(BASE_URL), f)
+            else:
+                log.info("Reusing stored admin session")
+
+# Playwright driver and browser context shared by every test in the worker process
+playwright_session = None
+admin_context = None
+
+async def get_admin_context():
+    """Start Playwright and the admin browser context on first use, then keep returning them"""
+    global playwright_session, admin_context
+    if admin_context is None:
+        playwright_session = await async_playwright().start()
+        
+        # Launch browser with a persistent profile so the admin session cookie
+        # and the disk cache survive between runs (no context.route, which would bypass the cache)
+        admin_context = await playwright_session.chromium.launch_persistent_context(
+            user_data_dir=USER_DATA_DIR,
+            headless=HEADLESS,
+            viewport=DESKTOP_VIEWPORT,
+            args=['--disable-dev-shm-usage', f'--host-resolver-rules={HOST_RESOLVER_RULES}'],
+        )
+        admin_context.set_default_timeout(ACTION_TIMEOUT_MS)
+        admin_context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+    return admin_context
+
+async def close_admin_context():
+    """Shut down the shared browser context and the Playwright driver"""
+    global playwright_session, admin_context
+    if admin_context is not None:
+        await admin_context.close()
+        await playwright_session.stop()
+        playwright_session = admin_context = None
+
+# All tests share the worker's event loop, and with it the session-scoped browser context
+pytestmark = pytest.mark.asyncio(loop_scope='session')
+
+@pytest_asyncio.fixture(scope='session', loop_scope='session')
+async def context():
+    """Authenticated admin browser context shared by every test in the worker"""
+    context = await get_admin_context()
+    await login(context)
+    yield context
+    await flush_screenshots()
+    await close_admin_context()
+
+@pytest_asyncio.fixture(autouse=True, loop_scope='session')
+async def failure_screenshots(request, context):
+    """Screenshot every page a failing test left open, then close them"""
+    pages_before = set(context.pages)
+    yield
+    leftover = [page for page in context.pages if page not in pages_before]
+    report = getattr(request.node, 'rep_call', None)
+    if report is not None and report.failed:
+        name = re.sub(r'\W+', '_', request.node.name).strip('_')
+        for index, page in enumerate(leftover):
+            await snap(page, f'admin_test_error_{name}_{index}', always_write=True)
+    for page in leftover:
+        await page.close()
+
+async def test_persian_rtl_initial(context):
+    """TEST 1: the admin panel loads in Persian with an RTL layout"""
+    async with open_admin_page(context, 'persian') as page:
+        await snap(page, 'admin_test_1_persian_initial', baseline=True)
+        
+        # Check direction, sidebar and main content in one probe
+        state = await page.evaluate(LAYOUT_PROBE)
+        log.debug("layout probe: %s", state)
+        assert state['dir'] == 'rtl'
+        assert state['sidebarVisible']
+        assert state['mainVisible']
+
+async def test_switch_to_english(context):
+    """TESTS 2-3: switching to English flips the layout to LTR without the sidebar covering content"""
+    async with open_admin_page(context, 'persian') as page:
+        await switch_language(page, 'english')
+        await snap(page, 'admin_test_2_english_layout', baseline=True)
+        
+        state = await page.evaluate(LAYOUT_PROBE)
+        log.debug("layout probe: %s", state)
+        assert state['dir'] == 'ltr'
+        assert state['blocking'].get('isBlocking') is False, state['blocking']
+
+async def test_return_to_persian(context):
+    """TEST 6: switching from English back to Persian restores the RTL layout"""
+    async with open_admin_page(context, 'english') as page:
+        await switch_language(page, 'persian')
+        await snap(page, 'admin_test_6_persian_return', baseline=True)
+        
+        state = await page.evaluate(LAYOUT_PROBE)
+        log.debug("layout probe: %s", state)
+        assert state['dir'] == 'rtl'
+
+@pytest.mark.parametrize('path, label, group', NAV_CASES, ids=[label for _, label, _ in NAV_CASES])
+async def test_nav_sections(context, path, label, group):
+    """TESTS 4-5: every admin section and blog subsection renders in English"""
+    await navigate_and_capture(context, path, label, group)
+
+async def test_mobile_responsive(context):
+    """TESTS 7-8: the mobile sidebar opens and closes, then the layout recovers on desktop"""
+    async with open_admin_page(context, 'persian', viewport=MOBILE_VIEWPORT) as page:
+        await snap(page, 'admin_test_7_mobile_persian')
+        
+        state = await page.evaluate(LAYOUT_PROBE)
+        log.debug("layout probe: %s", state)
+        assert state['mobileMenuVisible']
+        
+        await page.click('[data-testid="open-sidebar"]')
+        await page.wait_for_function(SIDEBAR_IN_VIEW, timeout=5000)
+        await snap(page, 'admin_test_7_mobile_sidebar_open')
+        
+        # The close button lives inside the sidebar, which SIDEBAR_IN_VIEW has just
+        # confirmed is on screen
+        await page.click('[data-testid="close-sidebar"]')
+        await page.wait_for_function(SIDEBAR_OUT_OF_VIEW, timeout=5000)
+        
+        # Switch to English in mobile
+        await switch_language(page, 'english')
+        await page.wait_for_function(SIDEBAR_OUT_OF_VIEW, timeout=5000)
+        await snap(page, 'admin_test_7_mobile_english')
         
-        finally:
-            await browser.close()
+        # Return to desktop view
+        await page.set_viewport_size(DESKTOP_VIEWPORT)
+        await wait_for_viewport_width(page, DESKTOP_VIEWPORT['width'])
+        await page.wait_for_function(SIDEBAR_IN_VIEW, timeout=5000)
+        await snap(page, 'admin_test_8_final_desktop', baseline=True)
 
 if __name__ == "__main__":
-    asyncio.run(test_bilingual_admin_panel())
\ No newline at end of file
+    sys.exit(pytest.main([__file__, '--maxfail=1', *sys.argv[1:]]))
\ No newline at end of file